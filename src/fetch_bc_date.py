@@ -9,35 +9,75 @@ with one sheet per (company × API) combination.
 TXO patterns used:
 - Logger singleton and hierarchical context logging
 - Hard-fail configuration access
-- ApiManager/create_rest_api for HTTP
+- ApiManager/create_rest_api for token handling; httpx (HTTP/2) for concurrent OData $batch/GETs
 - Dir.* for path management
 - ProcessingResults pattern for final ✅/❌ summary
 - TxoDataHandler.get_utc_timestamp() for timestamps
 
 Run:
     python src/fetch_bc_date.py chris test
+    python src/fetch_bc_date.py chris test --format json   # raw JSON per (company × API), no Excel
 """
+import asyncio
+import gzip
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+import uuid
+import zipfile
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, TYPE_CHECKING
+from email import policy
+from email.parser import BytesParser
+from typing import IO, Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 from pathlib import Path
+from urllib.parse import quote, urlencode
+
+import httpx
+import orjson
 
 # TXO utils (do not replace with custom functions)
 from utils.logger import setup_logger
-from utils.script_runner import parse_args_and_load_config
+from utils.script_runner import ArgumentDefinition, parse_custom_args_and_load_config
 from utils.load_n_save import TxoDataHandler
-from utils.path_helpers import Dir, get_path
+from utils.path_helpers import Dir, format_size, get_path
 from utils.api_factory import ApiManager
+from utils.api_common import AdaptiveConcurrencyLimiter, AsyncRateLimiter, apply_jitter, header_seconds
 from utils.exceptions import (
     HelpfulError, ApiError, ApiAuthenticationError, ApiTimeoutError,
-    FileOperationError, ConfigurationError
+    ApiOperationError, ApiRateLimitError, FileOperationError, ConfigurationError,
+    ValidationError
 )
 
-if TYPE_CHECKING:
-    import pandas as pd  # type: ignore
-
 logger = setup_logger()
 data_handler = TxoDataHandler()
 
+# business-central.apis entry: entity name or {"name", "select", "top", "filter", "count"}
+ApiEntry = Union[str, Dict[str, Any]]
+
+# Throttling/overload responses that shrink concurrency and are retried
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# --format choices: Excel workbook, raw JSON per (company × API), or both
+OUTPUT_FORMATS = ["xlsx", "json", "both"]
+
+# Process-wide rate limiters keyed by API base URL, so repeated runs in one
+# process keep respecting the budget left over from earlier calls
+_rate_limiters: Dict[str, AsyncRateLimiter] = {}
+
+# Below this many rows the worker start-up and merge pass cost more than
+# serialising the sheets in-process
+PARALLEL_WRITE_MIN_ROWS = 50_000
+
+# Archive member of the n-th (1-based) worksheet in an openpyxl-written workbook
+SHEET_PART = "xl/worksheets/sheet{0}.xml"
+
+# Buffer size for streaming worksheet XML between archives and cache files
+COPY_CHUNK = 64 * 1024
+
 
 @dataclass
 class ProcessingResults:
@@ -60,42 +100,758 @@ class ProcessingResults:
 
 
 def _safe_sheet_name(name: str) -> str:
-    """Excel sheet name constraints: max 31 chars, disallow : \\ / ? * [ ]"""
+    """
+    Excel sheet name constraints: max 31 chars, disallow : \\ / ? * [ ]
+
+    Truncated names end in a short hash of the original name so that two long
+    names sharing a prefix do not collide and overwrite each other's sheet.
+    """
     invalid = set(':\\/?*[]')
     cleaned = ''.join(ch for ch in name if ch not in invalid)
-    return cleaned[:31] if len(cleaned) > 31 else cleaned
+    if len(cleaned) > 31:
+        return f"{cleaned[:24]}_{hashlib.blake2b(name.encode('utf-8'), digest_size=3).hexdigest()}"
+    return cleaned
+
+
+def _safe_filename(name: str) -> str:
+    """File name valid on Windows and POSIX: drop < > : " / \\ | ? * and control characters."""
+    invalid = set('<>:"/\\|?*')
+    return ''.join(ch for ch in name if ch not in invalid and ch >= ' ')
+
+
+def _cache_dir(config: Dict[str, Any]) -> str:
+    """Cache directory under Dir.OUTPUT for one org/env, so runs for other configs keep their entries."""
+    return f".bc_cache/{_safe_filename(config['_org_id'])}-{_safe_filename(config['_env_type'])}"
 
 
-def _build_bc_url(config: Dict[str, Any], environment_name: str, company: str, api_name: str) -> str:
+def _build_odata_root(config: Dict[str, Any], environment_name: str) -> str:
     base_url = config['global']['api-base-url'].rstrip('/')
     api_version = config['global']['api-version']
     tenant_id = config['global']['tenant-id']
     # Example:
-    # https://api.businesscentral.dynamics.com/v2.0/{tenant}/{environment}/ODataV4/Company('TXO')/IntercompanyPartner
-    return (f"{base_url}/{api_version}/{tenant_id}/{environment_name}/ODataV4/"
-            f"Company('{company}')/{api_name}")
+    # https://api.businesscentral.dynamics.com/v2.0/{tenant}/{environment}/ODataV4
+    return f"{base_url}/{api_version}/{tenant_id}/{environment_name}/ODataV4"
+
+
+def _company_path(company: str) -> str:
+    """Company segment relative to the OData root, percent-encoded (once per company)."""
+    # Example: Company('TXO') -> entity URLs are {root}/Company('TXO')/IntercompanyPartner
+    return quote(f"Company('{company}')", safe="()'")
+
+
+def _with_query(url: str, options: Dict[str, Any]) -> str:
+    """Append OData query options to an entity URL or path."""
+    if not options:
+        return url
+    query = urlencode(options, quote_via=quote, safe="$,'()")
+    return f"{url}?{query}"
+
+
+def _api_name(api: ApiEntry) -> str:
+    """API entries are either a bare entity name or {"name": ..., query options}."""
+    return api if isinstance(api, str) else api['name']
+
+
+def _query_options(api: ApiEntry) -> Dict[str, Any]:
+    """
+    Build the OData query options for an API entry.
+
+    Dict entries may push projection down to BC with "select" (list of
+    fields), "top" (row cap) and "filter" (OData $filter expression), so
+    only the needed columns/rows are read and transferred. "count": true
+    requests $count=true so a large paged collection can be read with
+    concurrent $skip pages; it costs BC an extra COUNT, so it is opt-in.
+    """
+    options: Dict[str, Any] = {}
+    if isinstance(api, str):
+        return options
+    if api.get('select'):
+        options['$select'] = ','.join(api['select'])
+    if api.get('top'):
+        options['$top'] = api['top']
+    if api.get('filter'):
+        options['$filter'] = api['filter']
+    if api.get('count'):
+        options['$count'] = 'true'
+    return options
+
+
+def _extract_records(payload: Any, context: str) -> List[Dict[str, Any]]:
+    """
+    Pull the record list out of an OData payload ({"value": [...]}).
+
+    Per-record '@odata.etag' metadata is dropped here, in place, so it never
+    reaches the output writers.
+    """
+    records = payload.get('value') if isinstance(payload, dict) else None
+    if records is None:
+        # Soft-fail OK for external data as per ADR-B003
+        logger.warning(f"{context} Unexpected response format; coercing to list")
+        records = payload if isinstance(payload, list) else []
+    for record in records:
+        if isinstance(record, dict):
+            record.pop('@odata.etag', None)
+    return records
+
+
+def _get_rate_limiter(config: Dict[str, Any]) -> Optional[AsyncRateLimiter]:
+    """Return the shared async rate limiter, or None when rate limiting is disabled."""
+    rate_config = config['script-behavior']['rate-limiting']
+    if not rate_config['enabled']:
+        return None
+
+    key = config['global']['api-base-url']
+    if key not in _rate_limiters:
+        _rate_limiters[key] = AsyncRateLimiter(
+            calls_per_second=rate_config['calls-per-second'],
+            burst_size=rate_config['burst-size']
+        )
+        logger.debug(f"Created async rate limiter for {key}: "
+                     f"{rate_config['calls-per-second']} cps, burst={rate_config['burst-size']}")
+    return _rate_limiters[key]
+
+
+class ResponseCache:
+    """
+    ETag cache for idempotent OData GETs, persisted between runs.
+
+    Requests for a cached URL send If-None-Match; a 304 Not Modified reuses
+    the stored payload instead of transferring and parsing it again. Only
+    entries used during a run are written back, so stale URLs drop out; a
+    run that used no entry at all (e.g. every request failed) leaves the
+    file untouched.
+    """
+
+    FILENAME = "odata-etag-cache.json"
+
+    def __init__(self, entries: Dict[str, Dict[str, Any]], filename: str):
+        self._entries = entries
+        self._filename = filename
+        self._used: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, cache_dir: str) -> 'ResponseCache':
+        """Load the cache file in Dir.OUTPUT/cache_dir; a missing or unreadable file starts empty."""
+        filename = f"{cache_dir}/{cls.FILENAME}"
+        path = get_path(Dir.OUTPUT, filename, ensure_parent=False)
+        try:
+            # Read directly with orjson: the cache holds whole table payloads
+            entries = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return cls({}, filename)
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable response cache: {e}")
+            return cls({}, filename)
+        return cls(entries if isinstance(entries, dict) else {}, filename)
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """Conditional-request headers for a URL (empty when not cached)."""
+        entry = self._entries.get(url)
+        return {"If-None-Match": entry['etag']} if entry else {}
+
+    def hit(self, url: str) -> Any:
+        """Return the cached payload for a URL answered with 304 Not Modified."""
+        entry = self._entries[url]
+        self._used[url] = entry
+        return entry['payload']
+
+    def store(self, url: str, etag: Optional[str], payload: Any) -> None:
+        """Remember a fresh payload when the server supplied an ETag."""
+        if etag:
+            self._used[url] = {"etag": etag, "payload": payload}
+
+    def save(self) -> None:
+        """Persist entries used during this run (a failed write only costs the next run a refetch)."""
+        if not self._used:
+            logger.debug("Response cache unused this run; keeping existing entries")
+            return
+        try:
+            data_handler.save(self._used, Dir.OUTPUT, self._filename, compact=True)
+        except (FileOperationError, ValidationError) as e:
+            logger.warning(f"Could not save response cache: {e}")
+
+
+class SheetCache:
+    """
+    Rendered worksheet XML from earlier runs, keyed by a hash of the records.
+
+    openpyxl writes strings inline, so a worksheet part does not depend on
+    the rest of the workbook and can be dropped unchanged into a new one.
+    Entries are streamed to and from gzip files one sheet at a time; entries
+    not used during a run are deleted on save. Each org/env has its own
+    directory, so runs for other configs do not prune each other's entries.
+    """
+
+    DIRNAME = "sheets"
+
+    def __init__(self, directory: Path):
+        self._dir = directory
+        self._used: set = set()
+
+    @classmethod
+    def open(cls, cache_dir: str) -> 'SheetCache':
+        """Open (creating if needed) the sheet cache in Dir.OUTPUT/cache_dir."""
+        directory = get_path(Dir.OUTPUT, f"{cache_dir}/{cls.DIRNAME}")
+        directory.mkdir(exist_ok=True)
+        return cls(directory)
+
+    @staticmethod
+    def fingerprint(records: List[Dict[str, Any]]) -> str:
+        """Content hash of a sheet's records; key order counts, as it sets column order."""
+        digest = hashlib.blake2b(digest_size=16)
+        for record in records:  # One record at a time, never the whole sheet as JSON
+            digest.update(orjson.dumps(record))
+            digest.update(b'\n')
+        return digest.hexdigest()
+
+    def _path(self, fingerprint: str) -> Path:
+        return self._dir / f"{fingerprint}.xml.gz"
+
+    def get(self, fingerprint: str) -> Optional[Path]:
+        """Return the path of a cached entry (gzip'd worksheet XML), or None."""
+        path = self._path(fingerprint)
+        if not path.is_file():
+            return None
+        self._used.add(fingerprint)
+        return path
+
+    def store(self, fingerprint: str, stream: IO[bytes]) -> None:
+        """Stream one sheet's worksheet XML into its entry (a failure only costs a re-render)."""
+        if fingerprint in self._used:
+            return
+        path = self._path(fingerprint)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            with gzip.open(tmp_path, 'wb', compresslevel=1) as target:
+                shutil.copyfileobj(stream, target, COPY_CHUNK)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not store sheet cache entry {fingerprint}: {e}")
+            return
+        self._used.add(fingerprint)
+
+    def save(self) -> None:
+        """Drop entries not used during this run."""
+        try:
+            for path in self._dir.glob("*.xml.gz"):
+                if path.name.split('.', 1)[0] not in self._used:
+                    path.unlink()
+        except OSError as e:
+            logger.warning(f"Could not prune sheet cache: {e}")
+
+
+@dataclass
+class FetchClient:
+    """Shared HTTP state for one fetch run: HTTP/2 client, limiters and response cache."""
+    http: httpx.AsyncClient
+    limiter: AdaptiveConcurrencyLimiter
+    rate_limiter: Optional[AsyncRateLimiter]
+    script_behavior: Dict[str, Any]
+    cache: ResponseCache
+
+
+async def _request(client: FetchClient, method: str, url: str, context: str,
+                   **kwargs) -> Tuple[int, bytes, Mapping[str, str]]:
+    """
+    Send one HTTP request and return (status, body, headers).
+
+    Runs under the shared AIMD limiter: 429/5xx and timeouts shrink the
+    allowed concurrency and are retried with backoff (honouring Retry-After),
+    successes let it grow back. When rate limiting is enabled every attempt
+    also takes a token from the shared bucket, which is fed the rate-limit
+    headers of each response.
+    """
+    retry_config = client.script_behavior['retry-strategy']
+    max_attempts = max(1, retry_config['max-retries'])
+    last_error: Optional[ApiError] = None
+
+    for attempt in range(max_attempts):
+        delay = retry_config['backoff-factor'] ** attempt
+        async with client.limiter:
+            if client.rate_limiter:
+                await client.rate_limiter.acquire()
+            started = time.monotonic()
+            try:
+                resp = await client.http.request(method, url, **kwargs)
+                if client.rate_limiter:
+                    client.rate_limiter.update_from_headers(resp.headers)
+                if resp.status_code in RETRYABLE_STATUS:
+                    client.limiter.record_throttle(started)
+                    delay = header_seconds(resp.headers, 'Retry-After') or delay
+                    if resp.status_code == 429:
+                        last_error = ApiRateLimitError(f"{method} rate limited: {url}")
+                    else:
+                        last_error = ApiOperationError(f"HTTP {resp.status_code} for {method} {url}",
+                                                       status_code=resp.status_code)
+                elif resp.status_code in (401, 403):
+                    raise ApiAuthenticationError(f"HTTP {resp.status_code} for {method} {url}")
+                elif resp.status_code >= 400:
+                    raise ApiOperationError(f"HTTP {resp.status_code}: {resp.text[:200]}",
+                                            status_code=resp.status_code)
+                else:
+                    client.limiter.record_success()
+                    return resp.status_code, resp.content, resp.headers
+            except httpx.TimeoutException:
+                client.limiter.record_throttle(started)
+                last_error = ApiTimeoutError(f"{method} request timed out: {url}")
+            except httpx.HTTPError as e:
+                last_error = ApiOperationError(f"{method} request failed: {e}")
+
+        if attempt < max_attempts - 1:
+            # Sleep outside the limiter so the slot is free for other requests
+            jittered_delay = apply_jitter(delay, client.script_behavior['jitter'])
+            logger.warning(f"{context} {last_error}, retrying in {jittered_delay:.1f}s "
+                           f"(attempt {attempt + 1}/{max_attempts}, concurrency={client.limiter.limit})")
+            await asyncio.sleep(jittered_delay)
+
+    raise last_error
+
+
+async def _get_json(client: FetchClient, url: str, context: str) -> Any:
+    """GET a URL and decode its JSON body, revalidating cached responses by ETag."""
+    status, body, headers = await _request(client, "GET", url, context,
+                                           headers=client.cache.request_headers(url))
+    if status == 304:
+        logger.debug(f"{context} Not modified, using cached response")
+        return client.cache.hit(url)
+    # orjson parses the raw bytes directly, without decoding to str first
+    payload = orjson.loads(body) if body else {}
+    client.cache.store(url, headers.get('etag'), payload)
+    return payload
+
+
+async def _read_pages(client: FetchClient, entity_url: str, options: Dict[str, Any],
+                      payload: Any, context: str) -> List[Dict[str, Any]]:
+    """
+    Collect all records of a collection, starting from its first page.
+
+    When the first page carries @odata.nextLink and reports @odata.count
+    (requested with "count": true, or returned by the server anyway), the
+    remaining pages are requested concurrently with $skip/$top; otherwise
+    the nextLink chain is followed page by page. Pages are
+    concatenated in order.
+    """
+    # Copy: the first page's list is shared with the response cache entry
+    records = list(_extract_records(payload, context))
+    next_link = payload.get('@odata.nextLink') if isinstance(payload, dict) else None
+    if not next_link:
+        return records
+
+    total = payload.get('@odata.count')
+    if isinstance(total, int) and records:
+        limit = min(total, options['$top']) if '$top' in options else total
+        page_size = len(records)
+        page_options = {k: v for k, v in options.items() if k != '$count'}
+        page_urls = [
+            _with_query(entity_url, {**page_options, '$skip': skip, '$top': min(page_size, limit - skip)})
+            for skip in range(page_size, limit, page_size)
+        ]
+        logger.info(f"{context} Fetching {len(page_urls)} more pages concurrently ({limit} rows)")
+        pages = await asyncio.gather(*(_get_json(client, url, context) for url in page_urls))
+        for page in pages:
+            records.extend(_extract_records(page, context))
+        return records
+
+    page_num = 1
+    while next_link:
+        page_num += 1
+        logger.debug(f"{context} Following @odata.nextLink (page {page_num})")
+        page = await _get_json(client, next_link, context)
+        records.extend(_extract_records(page, context))
+        next_link = page.get('@odata.nextLink') if isinstance(page, dict) else None
+    return records
+
+
+async def _fetch_one(client: FetchClient, entity_url: str, options: Dict[str, Any],
+                     context: str) -> List[Dict[str, Any]]:
+    """GET a single OData collection (all pages) and return its records."""
+    url = _with_query(entity_url, options)
+    logger.info(f"{context} GET {url}")
+    payload = await _get_json(client, url, context)
+    return await _read_pages(client, entity_url, options, payload, context)
 
 
-def _to_dataframe(records: List[Dict[str, Any]]):
-    """Create a DataFrame only when needed (lazy import)."""
-    import pandas as pd  # Lazy import to follow TXO performance guidance
-    if not records:
-        # Create an empty DF with a placeholder column so Excel has a table
-        return pd.DataFrame([{"_no_rows": True}]).iloc[0:0]
-    return pd.DataFrame.from_records(records)
+def _build_batch_body(parts: List[Tuple[str, Dict[str, str]]], boundary: str) -> bytes:
+    """Build a multipart/mixed OData $batch body with one GET part per (path, headers)."""
+    lines: List[str] = []
+    for path, headers in parts:
+        lines += [
+            f"--{boundary}",
+            "Content-Type: application/http",
+            "Content-Transfer-Encoding: binary",
+            "",
+            f"GET {path} HTTP/1.1",
+            "Accept: application/json",
+            *(f"{name}: {value}" for name, value in headers.items()),
+            "",
+        ]
+    lines.append(f"--{boundary}--")
+    return ("\r\n".join(lines) + "\r\n").encode('utf-8')
+
+
+def _parse_batch_response(body: bytes, content_type: str) -> List[Tuple[int, Dict[str, str], bytes]]:
+    """
+    Split a multipart/mixed $batch response into sub-responses, in order.
+
+    Returns (status, headers with lower-cased names, body) per sub-response.
+    """
+    message = BytesParser(policy=policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode('utf-8') + body
+    )
+    if not message.is_multipart():
+        return []
+
+    responses: List[Tuple[int, Dict[str, str], bytes]] = []
+    for part in message.iter_parts():
+        # Each part is an embedded HTTP response: status line, headers, blank line, body
+        raw = (part.get_payload(decode=True) or b'').replace(b'\r\n', b'\n')
+        head, _, payload = raw.partition(b'\n\n')
+        status_line, *header_lines = head.decode('utf-8', errors='replace').split('\n')
+        status_parts = status_line.split()
+        status = int(status_parts[1]) if len(status_parts) > 1 and status_parts[1].isdigit() else 0
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        responses.append((status, headers, payload.strip()))
+    return responses
+
+
+async def _fetch_batch(client: FetchClient, odata_root: str, company: str, api_names: List[str],
+                       queries: Dict[str, Dict[str, Any]], env_label: str) -> List[Any]:
+    """
+    Fetch several APIs of one company with a single OData $batch POST.
+
+    Returns one outcome per API, in order: the record list or the raised
+    exception. Further pages of each collection are read outside the batch.
+    Sub-requests that were throttled (RETRYABLE_STATUS) or cannot be parsed
+    are re-issued as individual GETs so they get the normal retry handling;
+    other 4xx/5xx sub-responses cannot succeed on retry and become
+    ApiAuthenticationError (401/403) or ApiOperationError outcomes directly.
+    A 501 for the whole batch falls back to individual GETs for every API.
+    """
+    options = [queries[api_name] for api_name in api_names]
+    company_path = _company_path(company)
+    entity_paths = [f"{company_path}/{quote(api_name, safe='')}" for api_name in api_names]
+    entity_urls = [f"{odata_root}/{path}" for path in entity_paths]
+    paths = [_with_query(path, query) for path, query in zip(entity_paths, options)]
+    urls = [f"{odata_root}/{path}" for path in paths]
+    contexts = [f"[{env_label}/{company}/{api_name}]" for api_name in api_names]
+
+    if len(paths) == 1:
+        return [await _fetch_one(client, entity_urls[0], options[0], contexts[0])]
+
+    context = f"[{env_label}/{company}/$batch]"
+    boundary = f"batch_{uuid.uuid4().hex}"
+    logger.info(f"{context} POST $batch with {len(paths)} requests")
+    try:
+        _, body, headers = await _request(
+            client, "POST", f"{odata_root}/$batch", context,
+            content=_build_batch_body([(path, client.cache.request_headers(url))
+                                    for path, url in zip(paths, urls)], boundary),
+            headers={
+                "Content-Type": f"multipart/mixed; boundary={boundary}",
+                "Accept": "multipart/mixed",
+            }
+        )
+        responses = _parse_batch_response(body, headers.get('content-type', ''))
+    except ApiOperationError as e:
+        if e.status_code != 501:
+            raise
+        logger.warning(f"{context} $batch not supported, falling back to individual requests")
+        responses = []
+
+    outcomes: List[Any] = [None] * len(paths)
+    pending: Dict[int, Any] = {}
+    for index in range(len(paths)):
+        status, part_headers, body = responses[index] if index < len(responses) else (0, {}, b'')
+        if status == 304:
+            logger.debug(f"{contexts[index]} Not modified, using cached response")
+            payload = client.cache.hit(urls[index])
+            pending[index] = _read_pages(client, entity_urls[index], options[index], payload, contexts[index])
+            continue
+        if 200 <= status < 300:
+            try:
+                payload = orjson.loads(body) if body else {}
+            except orjson.JSONDecodeError:
+                logger.warning(f"{contexts[index]} Invalid JSON in $batch sub-response, retrying individually")
+            else:
+                client.cache.store(urls[index], part_headers.get('etag'), payload)
+                pending[index] = _read_pages(client, entity_urls[index], options[index], payload, contexts[index])
+                continue
+        elif status in (401, 403):
+            outcomes[index] = ApiAuthenticationError(f"HTTP {status} for GET {urls[index]}")
+            continue
+        elif status >= 400 and status not in RETRYABLE_STATUS:
+            outcomes[index] = ApiOperationError(
+                f"HTTP {status}: {body[:200].decode('utf-8', errors='replace')}", status_code=status
+            )
+            continue
+        elif responses:
+            logger.warning(f"{contexts[index]} $batch sub-request returned HTTP {status}, "
+                           f"retrying individually")
+        pending[index] = _fetch_one(client, entity_urls[index], options[index], contexts[index])
+
+    results = await asyncio.gather(*pending.values(), return_exceptions=True)
+    for index, result in zip(pending, results):
+        outcomes[index] = result
+    return outcomes
+
+
+async def _fetch_all(config: Dict[str, Any], environment_name: str, companies: List[str],
+                     apis: List[ApiEntry], headers: Dict[str, str]) -> Dict[Tuple[str, str], Any]:
+    """
+    Fetch every (company, api) combination concurrently over one shared client.
+
+    The client speaks HTTP/2 where the server offers it, so concurrent GETs are
+    multiplexed over a single TCP+TLS connection instead of one per request.
+
+    APIs are bundled per company into OData $batch requests of up to
+    business-central.batch-size sub-requests (1 disables batching), each
+    carrying the API's $select/$top/$filter options.
+
+    Returns:
+        {(company, api): record list on success, or the raised exception}
+    """
+    env_label = config['_env_type'].title()
+    script_behavior = config['script-behavior']
+    batch_size = config['business-central']['batch-size']
+    odata_root = _build_odata_root(config, environment_name)
+    timeout = httpx.Timeout(script_behavior['api-timeouts']['rest-timeout-seconds'])
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=64)
+    limiter = AdaptiveConcurrencyLimiter(max_limit=config['business-central']['max-concurrency'])
+    rate_limiter = _get_rate_limiter(config)
+
+    queries = {_api_name(api): _query_options(api) for api in apis}
+    api_names = list(queries)
+    chunks = [(company, api_names[i:i + batch_size])
+              for company in companies
+              for i in range(0, len(api_names), batch_size)]
+
+    cache = ResponseCache.load(_cache_dir(config))
+
+    async with httpx.AsyncClient(http2=True, headers=headers, timeout=timeout, limits=limits) as http:
+        client = FetchClient(http, limiter, rate_limiter, script_behavior, cache)
+        chunk_outcomes = await asyncio.gather(
+            *(_fetch_batch(client, odata_root, company, chunk, queries, env_label)
+              for company, chunk in chunks),
+            return_exceptions=True
+        )
+    cache.save()
+
+    outcomes: Dict[Tuple[str, str], Any] = {}
+    for (company, chunk), chunk_outcome in zip(chunks, chunk_outcomes):
+        for index, api_name in enumerate(chunk):
+            failed = isinstance(chunk_outcome, BaseException)
+            outcomes[(company, api_name)] = chunk_outcome if failed else chunk_outcome[index]
+    return outcomes
+
+
+def _write_sheet(wb: Any, sheet_name: str, records: List[Dict[str, Any]]) -> None:
+    """
+    Append records as a new sheet of a write-only workbook.
+
+    Header row is the union of record keys in first-seen order; rows are
+    streamed one at a time so no cell objects are kept in memory.
+    """
+    ws = wb.create_sheet(title=sheet_name)
+    headers = list(dict.fromkeys(key for record in records for key in record))
+    if not headers:
+        return
+    ws.append(headers)
+    for record in records:
+        ws.append([record.get(h) for h in headers])
+
+
+def _render_sheet_file(job: Tuple[List[Dict[str, Any]], str]) -> str:
+    """Worker: write records into a one-sheet write-only workbook at path, return the path."""
+    records, path = job
+    from openpyxl import Workbook  # Lazy import - runs in a worker process
+    wb = Workbook(write_only=True)
+    _write_sheet(wb, "Sheet", records)
+    wb.save(path)
+    return path
+
+
+@contextmanager
+def _open_sheet_part(source: Path) -> Iterator[IO[bytes]]:
+    """Stream worksheet XML from a sheet cache entry (.xml.gz) or a one-sheet workbook."""
+    if source.name.endswith(".xml.gz"):
+        with gzip.open(source, 'rb') as stream:
+            yield stream
+    else:
+        with zipfile.ZipFile(source) as archive, archive.open(SHEET_PART.format(1)) as stream:
+            yield stream
+
+
+def _replace_sheet_parts(output_path: Path, sources: Dict[int, Path]) -> None:
+    """
+    Swap pre-rendered worksheet XML into the placeholder sheets of a saved workbook.
+
+    Every archive member is streamed into a new archive that then replaces
+    output_path, so no worksheet is held in memory as a whole.
+    """
+    if not sources:
+        return
+    members = {SHEET_PART.format(index + 1): index for index in sources}
+    tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+    with zipfile.ZipFile(output_path) as archive, \
+            zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as target:
+        for item in archive.infolist():
+            member = zipfile.ZipInfo(item.filename, item.date_time)
+            member.compress_type = zipfile.ZIP_DEFLATED
+            member.external_attr = item.external_attr
+            index = members.get(item.filename)
+            with target.open(member, 'w') as dst:
+                if index is None:
+                    with archive.open(item) as src:
+                        shutil.copyfileobj(src, dst, COPY_CHUNK)
+                else:
+                    with _open_sheet_part(sources[index]) as src:
+                        shutil.copyfileobj(src, dst, COPY_CHUNK)
+    os.replace(tmp_path, output_path)
+
+
+def _write_workbook(sheets: Dict[str, List[Dict[str, Any]]], output_path: Path, cache_dir: str) -> None:
+    """
+    Write all sheets into one workbook at output_path.
+
+    Sheets whose records are unchanged since an earlier run reuse their cached
+    worksheet XML. Of the rest, large multi-sheet exports are rendered in
+    worker processes into one-sheet temp workbooks (the XML serialisation is
+    CPU-bound and holds the GIL); small ones are written in-process.
+    Pre-rendered parts replace empty placeholder sheets in the saved archive,
+    and newly rendered sheets are then streamed into the cache one by one.
+    """
+    from openpyxl import Workbook  # Lazy import to follow TXO performance guidance
+
+    names = list(sheets)
+    fingerprints = [SheetCache.fingerprint(sheets[name]) for name in names]
+    cache = SheetCache.open(cache_dir)
+    sources: Dict[int, Path] = {}
+    for index, fingerprint in enumerate(fingerprints):
+        cached = cache.get(fingerprint)
+        if cached is not None:
+            sources[index] = cached
+    reused = set(sources)
+    if reused:
+        logger.debug(f"Reusing {len(reused)}/{len(names)} unchanged sheets from the sheet cache")
+
+    pending = [index for index in range(len(names)) if index not in reused]
+    workers = min(len(pending), os.cpu_count() or 1)
+    pending_rows = sum(len(sheets[names[index]]) for index in pending)
+    parallel = workers >= 2 and pending_rows >= PARALLEL_WRITE_MIN_ROWS
+
+    tmp_root = get_path(Dir.TMP, "bc-sheets")
+    tmp_root.mkdir(exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=tmp_root) as tmp_dir:
+        if parallel:
+            logger.debug(f"Rendering {len(pending)} sheets ({pending_rows} rows) with {workers} worker processes")
+            jobs = [(sheets[names[index]], str(Path(tmp_dir) / f"sheet-{index:04d}.xlsx"))
+                    for index in pending]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for index, path in zip(pending, executor.map(_render_sheet_file, jobs)):
+                    sources[index] = Path(path)
+
+        wb = Workbook(write_only=True)
+        for index, name in enumerate(names):
+            if index in sources:
+                wb.create_sheet(title=name)  # Empty placeholder, replaced below
+            else:
+                _write_sheet(wb, name, sheets[name])
+        wb.save(output_path)
+
+        _replace_sheet_parts(output_path, sources)
+
+    # Cache newly rendered sheets; entries served from the cache are not re-read
+    with zipfile.ZipFile(output_path) as archive:
+        for index, fingerprint in enumerate(fingerprints):
+            if index not in reused:
+                with archive.open(SHEET_PART.format(index + 1)) as stream:
+                    cache.store(fingerprint, stream)
+    cache.save()
+
+
+def _write_excel(sheets: Dict[str, List[Dict[str, Any]]], excel_filename: str,
+                 env_label: str, cache_dir: str) -> Optional[Path]:
+    """
+    Write the fetched sheets to Dir.OUTPUT/excel_filename.
+
+    Unchanged sheets are reused from the sheet cache in Dir.OUTPUT/cache_dir.
+
+    openpyxl (and lxml) are imported only here, after configuration and
+    fetching have succeeded and there is at least one sheet to write, so
+    failure and JSON-only runs never pay for them.
+
+    Returns:
+        Path of the written workbook, or None when there was nothing to write
+    """
+    if not sheets:
+        logger.warning(f"[{env_label}/Excel/Write] Nothing to write")
+        return None
+
+    output_path = get_path(Dir.OUTPUT, excel_filename, ensure_parent=True)
+
+    # openpyxl picks lxml automatically when importable; its pure-Python
+    # fallback is roughly twice as slow and memory hungry for large sheets
+    from openpyxl.xml import LXML
+    if not LXML:
+        raise HelpfulError(
+            what_went_wrong="openpyxl is not using the lxml XML backend.",
+            how_to_fix="Install lxml (declared in pyproject.toml) and unset OPENPYXL_LXML if it is set to False.",
+            example="uv pip install -r pyproject.toml"
+        )
+
+    try:
+        # Stream rows straight from the JSON records: write-only mode serialises
+        # each row as it is appended instead of holding a cell model in memory
+        _write_workbook(sheets, output_path, cache_dir)
+        logger.info(f"[{env_label}/Excel/Write] Wrote {output_path}")
+    except Exception as e:
+        raise FileOperationError(f"Failed to write Excel file: {output_path}") from e
+    return output_path
+
+
+def _write_json(records: List[Dict[str, Any]], filename: str) -> Path:
+    """
+    Write one (company × API) record list to Dir.OUTPUT/filename as compact JSON.
+
+    Encodes with orjson straight to UTF-8 bytes. The records were parsed from
+    OData JSON, so they only hold JSON-native values and come out exactly as
+    the stdlib encoder would write them.
+    """
+    path = get_path(Dir.OUTPUT, filename)
+    try:
+        content = orjson.dumps(records)
+        path.write_bytes(content)
+    except OSError as e:
+        raise FileOperationError(f"Failed to save JSON file: {e}", file_path=str(path), operation='save') from e
+    logger.info(f"Saved JSON to {path} ({format_size(len(content))})")
+    return path
 
 
 def main() -> None:
     # 1) Initialize with TXO patterns
-    config = parse_args_and_load_config(
-        "Fetch Business Central configuration tables → Excel", require_token=True
+    config = parse_custom_args_and_load_config(
+        "Fetch Business Central configuration tables → Excel/JSON",
+        custom_args=[
+            ArgumentDefinition(
+                "format", default="xlsx", choices=OUTPUT_FORMATS, required=False,
+                help="Output format: xlsx workbook, raw JSON per (company × API), or both"
+            ),
+        ],
+        require_token=True
     )
+    output_format: str = config['_format']
+    write_excel = output_format in ("xlsx", "both")
+    write_json = output_format in ("json", "both")
 
     try:
         bc = config['business-central']
         environment_name = bc['environment-name']
         companies: List[str] = bc['companies']
-        apis: List[str] = bc['apis']
+        apis: List[ApiEntry] = bc['apis']
+        api_names = [_api_name(api) for api in apis]
         excel_filename: str = config['script-behavior']['excel-output-filename']
     except KeyError as e:
         raise ConfigurationError(f"Missing configuration key: {e}") from e
@@ -109,58 +865,56 @@ def main() -> None:
 
     # 2) Fetch and stage data
     results = ProcessingResults()
-    sheets: Dict[str, 'pd.DataFrame'] = {}
+    sheets: Dict[str, List[Dict[str, Any]]] = {}
+    json_outputs: Dict[str, List[Dict[str, Any]]] = {}
 
+    targets = [(company, api_name) for company in companies for api_name in api_names]
+
+    # Token acquisition stays with TXO ApiManager; httpx reuses its auth headers
     with ApiManager(config) as manager:
         api = manager.get_rest_api(require_auth=True)
-        env_label = config['_env_type'].title()
-
-        for company in companies:
-            for api_name in apis:
-                context = f"[{env_label}/{company}/{api_name}]"
-                url = _build_bc_url(config, environment_name, company, api_name)
-                logger.info(f"{context} GET {url}")
-                try:
-                    payload = api.get(url)  # TxoRestAPI handles retries, rate limits, auth
-                    # OData returns {"value": [...]}
-                    records = payload.get('value') if isinstance(payload, dict) else None
-                    if records is None:
-                        # Soft-fail OK for external data as per ADR-B003
-                        logger.warning(f"{context} Unexpected response format; coercing to list")
-                        records = payload if isinstance(payload, list) else []
-
-                    df = _to_dataframe(records)  # Lazy pandas import
-                    sheet_name = _safe_sheet_name(f"{company}__{api_name}")
-                    sheets[sheet_name] = df
-                    results.created.append(f"BusinessCentral/{company}/{api_name}")
-                    logger.info(f"{context} Retrieved {len(df)} rows")
-                except ApiAuthenticationError as e:
-                    msg = f"{context} Authentication error: {e}"
-                    logger.error(msg)
-                    results.failed.append(f"BusinessCentral/{company}/{api_name}: auth failed")
-                except ApiTimeoutError as e:
-                    msg = f"{context} Timeout: {e}"
-                    logger.error(msg)
-                    results.failed.append(f"BusinessCentral/{company}/{api_name}: timeout")
-                except ApiError as e:
-                    msg = f"{context} API error: {e}"
-                    logger.error(msg)
-                    results.failed.append(f"BusinessCentral/{company}/{api_name}: api error")
-                except Exception as e:  # Fallback; specific errors logged above when available
-                    logger.error(f"{context} Unexpected error: {e}")
-                    results.failed.append(f"BusinessCentral/{company}/{api_name}: unexpected error")
-
-    # 3) Write Excel (one sheet per (company×api))
-    output_path: Path = get_path(Dir.OUTPUT, excel_filename, ensure_parent=True)
-    try:
-        # Prefer using pandas.ExcelWriter to guarantee multi-sheet output
-        import pandas as pd  # Lazy import here too
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-            for sheet_name, df in sheets.items():
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-        logger.info(f"[{config['_env_type'].title()}/Excel/Write] Wrote {output_path}")
-    except Exception as e:
-        raise FileOperationError(f"Failed to write Excel file: {output_path}") from e
+        outcomes = asyncio.run(_fetch_all(config, environment_name, companies, apis, dict(api.headers)))
+
+    env_label = config['_env_type'].title()
+    for company, api_name in targets:
+        context = f"[{env_label}/{company}/{api_name}]"
+        outcome = outcomes[(company, api_name)]
+        try:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            records = outcome
+
+            sheet_name = _safe_sheet_name(f"{company}__{api_name}")
+            sheets[sheet_name] = records
+            json_outputs[f"{_safe_filename(f'{company}__{api_name}')}.json"] = records
+            results.created.append(f"BusinessCentral/{company}/{api_name}")
+            logger.info(f"{context} Retrieved {len(records)} rows")
+        except ApiAuthenticationError as e:
+            msg = f"{context} Authentication error: {e}"
+            logger.error(msg)
+            results.failed.append(f"BusinessCentral/{company}/{api_name}: auth failed")
+        except ApiTimeoutError as e:
+            msg = f"{context} Timeout: {e}"
+            logger.error(msg)
+            results.failed.append(f"BusinessCentral/{company}/{api_name}: timeout")
+        except ApiError as e:
+            msg = f"{context} API error: {e}"
+            logger.error(msg)
+            results.failed.append(f"BusinessCentral/{company}/{api_name}: api error")
+        except Exception as e:  # Fallback; specific errors logged above when available
+            logger.error(f"{context} Unexpected error: {e}")
+            results.failed.append(f"BusinessCentral/{company}/{api_name}: unexpected error")
+
+    # 3) Write outputs (one sheet / JSON file per (company×api))
+    json_files: List[str] = []
+    if write_json:
+        for filename, records in json_outputs.items():
+            json_path = _write_json(records, filename)
+            json_files.append(json_path.name)
+
+    output_path: Optional[Path] = None
+    if write_excel:
+        output_path = _write_excel(sheets, excel_filename, env_label, _cache_dir(config))
 
     # 4) Save a machine-readable summary
     ts = data_handler.get_utc_timestamp()
@@ -170,8 +924,10 @@ def main() -> None:
         "env": config["_env_type"],
         "environment-name": environment_name,
         "companies": companies,
-        "apis": apis,
-        "excel-file": str(output_path.name),
+        "apis": api_names,
+        "format": output_format,
+        "excel-file": output_path.name if output_path else None,
+        "json-files": json_files,
         "created": results.created,
         "failed": results.failed,
     }
@@ -10,6 +10,13 @@ Tests:
 - API factory with enhanced features
 - Error handling patterns with ErrorContext
 - Dir constants usage
+- Adaptive (AIMD) concurrency limiter
+- Async header-aware rate limiter
+- OData $batch response parsing (fetch_bc_date)
+- OData paging: concurrent $skip fan-out and nextLink chain (fetch_bc_date)
+- Collision-safe Excel sheet names (fetch_bc_date)
+- OData ETag response cache (fetch_bc_date)
+- Excel sheet cache and worker rendering round trip (fetch_bc_date)
 
 Usage:
     python test_features.py <org_id> <env_type>
@@ -18,6 +25,7 @@ Example:
     python test_features.py demo test
 """
 
+import asyncio
 import time
 from decimal import Decimal
 from datetime import datetime, timezone
@@ -27,8 +35,10 @@ from utils.logger import setup_logger
 from utils.load_n_save import TxoDataHandler
 from utils.path_helpers import Dir  # v3.0: Type-safe directory constants
 from utils.api_factory import create_rest_api, ApiManager
-from utils.exceptions import HelpfulError, ApiOperationError, ErrorContext
-from utils.api_common import RateLimiter, CircuitBreaker
+from utils.exceptions import HelpfulError, ApiOperationError, ApiAuthenticationError, ErrorContext
+from utils.api_common import (
+    RateLimiter, CircuitBreaker, AdaptiveConcurrencyLimiter, AsyncRateLimiter
+)
 
 logger = setup_logger()
 data_handler = TxoDataHandler()
@@ -358,6 +368,483 @@ def test_github_api(config: Dict[str, Any]) -> None:
     print()
 
 
+def _check(condition: bool, message: str) -> bool:
+    """Log a ✅/❌ line for one check and return whether it passed."""
+    if condition:
+        logger.info(f"✅ {message}")
+    else:
+        logger.error(f"❌ {message}")
+    return condition
+
+
+def _require(results: list, test_name: str) -> None:
+    """Raise so the summary marks the test FAIL when any check failed."""
+    if not all(results):
+        raise AssertionError(f"{results.count(False)} {test_name} check(s) failed")
+
+
+def test_adaptive_limiter(config: Dict[str, Any]) -> None:
+    """Test AIMD shrink (once per throttling event) and additive regrowth."""
+    logger.info("=" * 50)
+    logger.info("TEST 8: Adaptive Concurrency Limiter (AIMD)")
+    logger.info("=" * 50)
+
+    limiter = AdaptiveConcurrencyLimiter(max_limit=16)
+    max_in_flight = 0
+    in_flight = 0
+
+    async def throttled_request() -> None:
+        nonlocal in_flight, max_in_flight
+        async with limiter:
+            started = time.monotonic()
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            limiter.record_throttle(started)
+
+    async def burst() -> None:
+        await asyncio.gather(*(throttled_request() for _ in range(16)))
+
+    results = []
+    asyncio.run(burst())
+    results.append(_check(max_in_flight == 16, f"16 requests in flight at limit 16 (got {max_in_flight})"))
+    results.append(_check(limiter.limit == 8, f"Burst of 16 throttles halves once: 16 -> {limiter.limit}"))
+
+    limiter.record_throttle(time.monotonic())
+    results.append(_check(limiter.limit == 4, f"New throttling event halves again: 8 -> {limiter.limit}"))
+
+    for _ in range(8):
+        limiter.record_success()
+    results.append(_check(limiter.limit == 8, f"8 successes add 0.5 each: 4 -> {limiter.limit}"))
+
+    for _ in range(100):
+        limiter.record_success()
+    results.append(_check(limiter.limit == 16, f"Regrowth capped at max_limit (got {limiter.limit})"))
+
+    _require(results, "adaptive limiter")
+    print()
+
+
+def test_async_rate_limiter(config: Dict[str, Any]) -> None:
+    """Test async token spacing and header-driven pauses."""
+    logger.info("=" * 50)
+    logger.info("TEST 9: Async Rate Limiter (Token Bucket + Headers)")
+    logger.info("=" * 50)
+
+    async def timed_acquires(limiter: AsyncRateLimiter, count: int) -> float:
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(count)))
+        return time.monotonic() - start
+
+    results = []
+
+    # 6 concurrent calls at 20/s: the last one waits for 5 token intervals
+    limiter = AsyncRateLimiter(calls_per_second=20)
+    elapsed = asyncio.run(timed_acquires(limiter, 6))
+    results.append(_check(elapsed >= 5 / 20 * 0.9, f"6 calls at 20/s spaced over {elapsed:.2f}s (>= 0.25s)"))
+
+    # Budget nearly exhausted: pause until X-RateLimit-Reset
+    limiter = AsyncRateLimiter(calls_per_second=1000)
+    limiter.update_from_headers({"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "5",
+                                 "X-RateLimit-Reset": "0.3"})
+    elapsed = asyncio.run(timed_acquires(limiter, 1))
+    results.append(_check(elapsed >= 0.27, f"Low remaining budget paused {elapsed:.2f}s (>= 0.3s)"))
+
+    # Plenty of budget left: no pause
+    limiter = AsyncRateLimiter(calls_per_second=1000)
+    limiter.update_from_headers({"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "50",
+                                 "X-RateLimit-Reset": "5"})
+    elapsed = asyncio.run(timed_acquires(limiter, 1))
+    results.append(_check(elapsed < 0.1, f"Healthy budget did not pause ({elapsed:.2f}s)"))
+
+    # Retry-After pauses the whole bucket
+    limiter = AsyncRateLimiter(calls_per_second=1000)
+    limiter.update_from_headers({"Retry-After": "0.2"})
+    elapsed = asyncio.run(timed_acquires(limiter, 3))
+    results.append(_check(elapsed >= 0.18, f"Retry-After paused {elapsed:.2f}s (>= 0.2s)"))
+
+    async def fire_times(limiter: AsyncRateLimiter, count: int, pause_at: float = None,
+                         retry_after: str = None) -> list:
+        start = time.monotonic()
+        times = []
+
+        async def call() -> None:
+            await limiter.acquire()
+            times.append(time.monotonic() - start)
+
+        async def throttle() -> None:
+            await asyncio.sleep(pause_at)
+            limiter.update_from_headers({"Retry-After": retry_after})
+
+        extra = [throttle()] if pause_at is not None else []
+        await asyncio.gather(*(call() for _ in range(count)), *extra)
+        return sorted(times)
+
+    # Callers queued behind a pause are re-spaced after it, not released together
+    limiter = AsyncRateLimiter(calls_per_second=10)
+    limiter.update_from_headers({"Retry-After": "0.5"})
+    times = asyncio.run(fire_times(limiter, 6))
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    results.append(_check(times[0] >= 0.48, f"First call after pause at {times[0]:.2f}s (>= 0.5s)"))
+    results.append(_check(min(gaps) >= 0.09, f"Calls after pause spaced >= 0.1s (min gap {min(gaps):.2f}s)"))
+
+    # A pause set while callers sleep in acquire() holds them back too
+    limiter = AsyncRateLimiter(calls_per_second=10)
+    times = asyncio.run(fire_times(limiter, 6, pause_at=0.05, retry_after="0.5"))
+    early = [t for t in times if 0.02 < t < 0.53]
+    results.append(_check(not early, f"No queued call fired during the pause (got {early})"))
+    results.append(_check(len(times) == 6 and times[-1] >= 0.55 + 4 * 0.1 * 0.9,
+                          f"Queued calls resumed spaced after the pause (last at {times[-1]:.2f}s)"))
+
+    _require(results, "async rate limiter")
+    print()
+
+
+def test_batch_response_parsing(config: Dict[str, Any]) -> None:
+    """Test splitting an OData $batch multipart response into sub-responses."""
+    logger.info("=" * 50)
+    logger.info("TEST 10: OData $batch Response Parsing")
+    logger.info("=" * 50)
+
+    from src.fetch_bc_date import _parse_batch_response  # Script module - import on use
+
+    boundary = "batchresponse_test"
+    customer = '{"value":[{"No":"10000","Name":"Åsa Ström AB"}]}'
+    body = (
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\nContent-Transfer-Encoding: binary\r\n\r\n"
+        "HTTP/1.1 200 OK\r\nContent-Type: application/json; charset=utf-8\r\n"
+        'ETag: W/"JzQ0OzE7Jw=="\r\n\r\n'
+        f"{customer}\r\n"
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\nContent-Transfer-Encoding: binary\r\n\r\n"
+        'HTTP/1.1 304 Not Modified\r\nETag: W/"abc"\r\n\r\n\r\n'
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\nContent-Transfer-Encoding: binary\r\n\r\n"
+        "HTTP/1.1 404 Not Found\r\nContent-Type: application/json\r\n\r\n"
+        '{"error":{"code":"BadRequest_NotFound"}}\r\n'
+        f"--{boundary}--\r\n"
+    ).encode('utf-8')
+
+    responses = _parse_batch_response(body, f"multipart/mixed; boundary={boundary}")
+
+    results = [_check(len(responses) == 3, f"3 sub-responses parsed (got {len(responses)})")]
+    if len(responses) == 3:
+        (status_ok, headers_ok, body_ok), (status_304, headers_304, body_304), (status_404, _, _) = responses
+        results.append(_check(status_ok == 200 and body_ok == customer.encode('utf-8'),
+                              "200 part keeps its UTF-8 body byte for byte"))
+        results.append(_check(headers_ok.get('etag') == 'W/"JzQ0OzE7Jw=="',
+                              "Header names are lower-cased (etag)"))
+        results.append(_check(status_304 == 304 and body_304 == b'' and headers_304.get('etag') == 'W/"abc"',
+                              "304 part has no body and keeps its ETag"))
+        results.append(_check(status_404 == 404, "404 part status preserved"))
+    results.append(_check(_parse_batch_response(b'{"value": []}', "application/json") == [],
+                          "Non-multipart response yields no sub-responses"))
+
+    # Sub-response outcomes: only throttled parts are re-sent as individual GETs
+    import httpx
+    from src.fetch_bc_date import FetchClient, ResponseCache, _fetch_batch
+
+    odata_root = "https://bc.example/ODataV4"
+    sub_responses = [
+        ("200 OK", '{"value":[{"No":"1"}]}'),
+        ("404 Not Found", '{"error":{"code":"BadRequest_NotFound"}}'),
+        ("403 Forbidden", '{"error":{"code":"Authorization_Failed"}}'),
+        ("503 Service Unavailable", ''),
+    ]
+    individual_gets = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            parts = "".join(
+                f"--{boundary}\r\nContent-Type: application/http\r\n\r\n"
+                f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n\r\n{content}\r\n"
+                for status, content in sub_responses
+            )
+            return httpx.Response(200, content=f"{parts}--{boundary}--\r\n".encode('utf-8'),
+                                  headers={"Content-Type": f"multipart/mixed; boundary={boundary}"})
+        individual_gets.append(request.url.path.rsplit('/', 1)[-1])
+        return httpx.Response(200, json={"value": [{"No": "4"}]})
+
+    script_behavior = {
+        "retry-strategy": {"max-retries": 1, "backoff-factor": 1.0},
+        "jitter": {"min-factor": 1.0, "max-factor": 1.0}
+    }
+
+    async def fetch() -> list:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = FetchClient(http, AdaptiveConcurrencyLimiter(max_limit=4), None, script_behavior,
+                                 ResponseCache({}, ResponseCache.FILENAME))
+            return await _fetch_batch(client, odata_root, "TXO", ["Ok", "Missing", "Denied", "Busy"],
+                                      {"Ok": {}, "Missing": {}, "Denied": {}, "Busy": {}}, "Test")
+
+    ok, missing, denied, busy = asyncio.run(fetch())
+    results.append(_check(ok == [{"No": "1"}], "200 sub-response used directly"))
+    results.append(_check(isinstance(missing, ApiOperationError) and missing.status_code == 404,
+                          f"404 sub-response becomes ApiOperationError(404) ({type(missing).__name__})"))
+    results.append(_check(isinstance(denied, ApiAuthenticationError),
+                          f"403 sub-response becomes ApiAuthenticationError ({type(denied).__name__})"))
+    results.append(_check(busy == [{"No": "4"}] and individual_gets == ["Busy"],
+                          f"Only the 503 part was re-sent individually ({individual_gets})"))
+
+    _require(results, "batch parsing")
+    print()
+
+
+def test_odata_paging(config: Dict[str, Any]) -> None:
+    """Test _read_pages against a mocked OData endpoint (no network)."""
+    logger.info("=" * 50)
+    logger.info("TEST 11: OData Paging ($skip fan-out and nextLink chain)")
+    logger.info("=" * 50)
+
+    import httpx
+    from urllib.parse import parse_qs, urlsplit
+    from src.fetch_bc_date import FetchClient, ResponseCache, _query_options, _read_pages, _with_query
+
+    rows = [{"No": str(i)} for i in range(25)]
+    page_size = 10
+    entity_url = "https://bc.example/ODataV4/Company('TXO')/Customer"
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        query = {k: v[0] for k, v in parse_qs(urlsplit(str(request.url)).query).items()}
+        if 'page' in query:  # nextLink chain: page=N
+            page = int(query['page'])
+            body = {"value": rows[page * page_size:(page + 1) * page_size]}
+            if (page + 1) * page_size < len(rows):
+                body["@odata.nextLink"] = f"{entity_url}?page={page + 1}"
+            return httpx.Response(200, json=body)
+        skip = int(query.get('$skip', 0))
+        top = min(int(query.get('$top', page_size)), page_size)
+        return httpx.Response(200, json={"value": rows[skip:skip + top]})
+
+    script_behavior = {
+        "retry-strategy": {"max-retries": 1, "backoff-factor": 1.0},
+        "jitter": {"min-factor": 1.0, "max-factor": 1.0}
+    }
+
+    async def read(options: Dict[str, Any], first_page: Dict[str, Any]) -> list:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = FetchClient(http, AdaptiveConcurrencyLimiter(max_limit=4), None,
+                                 script_behavior, ResponseCache({}, ResponseCache.FILENAME))
+            return await _read_pages(client, entity_url, options, first_page, "[Test/TXO/Customer]")
+
+    # $count=true (an extra COUNT in BC) is only requested for "count": true entries
+    results = [
+        _check(_query_options("Customer") == {}, "Bare API name requests no $count"),
+        _check(_query_options({"name": "Customer", "top": 22}) == {"$top": 22}, "Dict entry without count: no $count"),
+        _check(_query_options({"name": "Customer", "top": 22, "count": True}) == {"$top": 22, "$count": "true"},
+               "\"count\": true opts in to $count=true"),
+    ]
+
+    # $skip fan-out: count=25 but $top=22 caps the rows read -> pages skip=10 (top 10), skip=20 (top 2)
+    first = {"value": rows[:page_size], "@odata.count": len(rows),
+             "@odata.nextLink": f"{entity_url}?$skip={page_size}"}
+    records = asyncio.run(read({"$count": "true", "$top": 22}, first))
+    expected_urls = sorted([_with_query(entity_url, {"$top": 10, "$skip": 10}),
+                            _with_query(entity_url, {"$top": 2, "$skip": 20})])
+    results.append(_check(records == rows[:22], f"$skip fan-out returned rows 0..21 in order (got {len(records)})"))
+    results.append(_check(sorted(requested) == expected_urls,
+                          f"$top capped the last page and $count was dropped: {sorted(requested)}"))
+    results.append(_check(len(first["value"]) == page_size, "First page payload left unmodified"))
+
+    # nextLink chain: no @odata.count -> follow links page by page
+    requested.clear()
+    first = {"value": rows[:page_size], "@odata.nextLink": f"{entity_url}?page=1"}
+    records = asyncio.run(read({}, first))
+    results.append(_check(records == rows, f"nextLink chain returned all {len(rows)} rows in order"))
+    results.append(_check(len(requested) == 2, f"Followed 2 nextLinks (got {len(requested)})"))
+
+    _require(results, "OData paging")
+    print()
+
+
+def test_response_cache(config: Dict[str, Any]) -> None:
+    """Test ETag revalidation and per-org/env persistence of the OData response cache (no network)."""
+    logger.info("=" * 50)
+    logger.info("TEST 13: OData Response Cache (ETag / 304)")
+    logger.info("=" * 50)
+
+    import shutil
+    import httpx
+    from urllib.parse import parse_qs, urlsplit
+    from utils.path_helpers import get_path
+    from src.fetch_bc_date import FetchClient, ResponseCache, _cache_dir, _fetch_one
+
+    rows = [{"No": str(i)} for i in range(15)]
+    entity_url = "https://bc.example/ODataV4/Company('TXO')/Customer"
+    statuses = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = parse_qs(urlsplit(str(request.url)).query)
+        page = int(query['page'][0]) if 'page' in query else 0
+        etag = f'W/"page{page}"'
+        if request.headers.get('If-None-Match') == etag:
+            statuses.append(304)
+            return httpx.Response(304, headers={"ETag": etag})
+        body = {"value": rows[page * 10:(page + 1) * 10]}
+        if page == 0:
+            body["@odata.nextLink"] = f"{entity_url}?page=1"
+        statuses.append(200)
+        return httpx.Response(200, json=body, headers={"ETag": etag})
+
+    script_behavior = {
+        "retry-strategy": {"max-retries": 1, "backoff-factor": 1.0},
+        "jitter": {"min-factor": 1.0, "max-factor": 1.0}
+    }
+
+    async def fetch(cache: ResponseCache) -> list:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = FetchClient(http, AdaptiveConcurrencyLimiter(max_limit=4), None, script_behavior, cache)
+            return await _fetch_one(client, entity_url, {}, "[Test/TXO/Customer]")
+
+    cache_dir = _cache_dir({"_org_id": "test_features", "_env_type": "cache"})
+    other_dir = _cache_dir({"_org_id": "test_features", "_env_type": "other"})
+    cache_path = get_path(Dir.OUTPUT, f"{cache_dir}/{ResponseCache.FILENAME}", ensure_parent=False)
+    results = []
+    try:
+        # Run 1: fresh fetch stores both pages with their ETags
+        cache = ResponseCache.load(cache_dir)
+        records = asyncio.run(fetch(cache))
+        cache.save()
+        results.append(_check(records == rows and statuses == [200, 200],
+                              f"First run fetched {len(records)} rows ({statuses})"))
+
+        # Run 2: both pages revalidate with If-None-Match and come back 304
+        statuses.clear()
+        cache = ResponseCache.load(cache_dir)
+        records = asyncio.run(fetch(cache))
+        results.append(_check(records == rows and statuses == [304, 304],
+                              f"Second run served {len(records)} rows from 304s ({statuses})"))
+        results.append(_check(len(cache.hit(entity_url)["value"]) == 10,
+                              "Cached first page not extended by later pages"))
+        cache.save()
+        saved = cache_path.read_bytes()
+
+        # A run that used no entries (e.g. every request failed) keeps the file
+        ResponseCache.load(cache_dir).save()
+        results.append(_check(cache_path.read_bytes() == saved, "Run without cache use left the file untouched"))
+
+        # Another org/env has its own cache and does not evict this one
+        other = ResponseCache.load(other_dir)
+        results.append(_check(other.request_headers(entity_url) == {}, "Other org/env starts with an empty cache"))
+        results.append(_check(ResponseCache.load(cache_dir).request_headers(entity_url) != {},
+                              "Entries of this org/env survive"))
+    finally:
+        for directory in (cache_dir, other_dir):
+            shutil.rmtree(get_path(Dir.OUTPUT, directory, ensure_parent=False), ignore_errors=True)
+
+    _require(results, "response cache")
+    print()
+
+
+def test_safe_sheet_name(config: Dict[str, Any]) -> None:
+    """Test Excel sheet name cleaning and collision-safe truncation."""
+    logger.info("=" * 50)
+    logger.info("TEST 12: Safe Sheet Names")
+    logger.info("=" * 50)
+
+    from src.fetch_bc_date import _safe_sheet_name
+
+    first = _safe_sheet_name("CRONUS Sverige AB__GeneralLedgerSetup")
+    second = _safe_sheet_name("CRONUS Sverige AB__GeneralLedgerEntries")
+    results = [
+        _check(first != second, f"Names sharing a 24-char prefix stay distinct: {first} / {second}"),
+        _check(len(first) <= 31 and len(second) <= 31, "Truncated names fit Excel's 31-char limit"),
+        _check(_safe_sheet_name("CRONUS Sverige AB__GeneralLedgerSetup") == first, "Truncation is deterministic"),
+        _check(_safe_sheet_name("TXO__IntercompanyPartner") == "TXO__IntercompanyPartner",
+               "Short names are unchanged"),
+        _check(_safe_sheet_name("A/B:C[1]") == "ABC1", "Invalid characters : \\ / ? * [ ] removed"),
+    ]
+
+    _require(results, "sheet name")
+    print()
+
+
+def test_sheet_cache_roundtrip(config: Dict[str, Any]) -> None:
+    """Test workbook writing with cached and worker-rendered sheets swapped into placeholders."""
+    logger.info("=" * 50)
+    logger.info("TEST 14: Sheet Cache Round Trip (placeholder sheets + part replacement)")
+    logger.info("=" * 50)
+
+    import os
+    import shutil
+    from openpyxl import load_workbook
+    from utils.path_helpers import get_path
+    import src.fetch_bc_date as fetch_bc
+    from src.fetch_bc_date import SheetCache, _cache_dir, _write_workbook
+
+    def table(prefix: str, count: int) -> list:
+        # None stays out of the last column: read-only mode trims trailing empty cells
+        return [{"No": f"{prefix}{i}", "Blocked": None if i % 2 else "Yes", "Amount": i * 10}
+                for i in range(count)]
+
+    def read_back(path) -> Dict[str, list]:
+        wb = load_workbook(path, read_only=True)
+        try:
+            return {ws.title: [list(row) for row in ws.iter_rows(values_only=True)] for ws in wb.worksheets}
+        finally:
+            wb.close()
+
+    def expected(sheets: Dict[str, list]) -> Dict[str, list]:
+        out = {}
+        for name, records in sheets.items():
+            headers = list(dict.fromkeys(key for record in records for key in record))
+            out[name] = [headers] + [[record.get(h) for h in headers] for record in records] if headers else []
+        return out
+
+    def cache_entries(cache_dir: str) -> int:
+        directory = get_path(Dir.OUTPUT, f"{cache_dir}/{SheetCache.DIRNAME}", ensure_parent=False)
+        return len(list(directory.glob("*.xml.gz")))
+
+    cache_dir = _cache_dir({"_org_id": "test_features", "_env_type": "sheets"})
+    other_dir = _cache_dir({"_org_id": "test_features", "_env_type": "sheets-workers"})
+    output_path = get_path(Dir.TMP, "test_features-sheet-cache.xlsx")
+    min_rows = fetch_bc.PARALLEL_WRITE_MIN_ROWS
+    cpu_count = os.cpu_count
+    results = []
+    try:
+        # Run 1: everything rendered in-process, then cached
+        first = {"A": table("a", 30), "B": table("b", 20), "Empty": [], "C": table("c", 5)}
+        _write_workbook(first, output_path, cache_dir)
+        book = read_back(output_path)
+        results.append(_check(list(book) == list(first) and book == expected(first),
+                              f"Fresh workbook round-trips ({len(book)} sheets)"))
+
+        # Run 2: B changed, order shuffled -> A, C and Empty come from the cache as placeholders
+        second = {"C": first["C"], "Empty": [], "B": table("b2-", 25), "A": first["A"]}
+        _write_workbook(second, output_path, cache_dir)
+        book = read_back(output_path)
+        results.append(_check(list(book) == list(second) and book == expected(second),
+                              "Rewrite with one changed sheet and shuffled order round-trips"))
+        results.append(_check(cache_entries(cache_dir) == 4,
+                              f"Superseded sheet pruned from the cache ({cache_entries(cache_dir)} entries)"))
+
+        # Run 3: unchanged -> every sheet is a cached placeholder
+        _write_workbook(second, output_path, cache_dir)
+        results.append(_check(read_back(output_path) == expected(second), "Fully cached rewrite round-trips"))
+
+        # Worker path: force parallel rendering into one-sheet temp workbooks (even on 1 CPU)
+        fetch_bc.PARALLEL_WRITE_MIN_ROWS = 0
+        os.cpu_count = lambda: 2
+        _write_workbook(first, output_path, other_dir)
+        book = read_back(output_path)
+        results.append(_check(list(book) == list(first) and book == expected(first),
+                              "Worker-rendered sheets round-trip"))
+        results.append(_check(cache_entries(cache_dir) == 4, "Other org/env cache left unpruned"))
+    finally:
+        fetch_bc.PARALLEL_WRITE_MIN_ROWS = min_rows
+        os.cpu_count = cpu_count
+        output_path.unlink(missing_ok=True)
+        for directory in (cache_dir, other_dir):
+            shutil.rmtree(get_path(Dir.OUTPUT, directory, ensure_parent=False), ignore_errors=True)
+
+    _require(results, "sheet cache")
+    print()
+
+
 def generate_summary_report(config: Dict[str, Any], test_results: Dict[str, bool]) -> None:
     """Generate and save test summary report using v3.0 patterns."""
     logger.info("=" * 50)
@@ -449,7 +936,14 @@ def main():
         ("universal_save", test_universal_save),
         ("api_factory", test_api_factory),
         ("error_context", test_error_context),
-        ("github_api", test_github_api)
+        ("github_api", test_github_api),
+        ("adaptive_limiter", test_adaptive_limiter),
+        ("async_rate_limiter", test_async_rate_limiter),
+        ("batch_response_parsing", test_batch_response_parsing),
+        ("odata_paging", test_odata_paging),
+        ("safe_sheet_name", test_safe_sheet_name),
+        ("response_cache", test_response_cache),
+        ("sheet_cache_roundtrip", test_sheet_cache_roundtrip)
     ]
 
     for test_name, test_func in tests:
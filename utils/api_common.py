@@ -3,14 +3,17 @@
 Common API utilities shared across different API types.
 
 Provides:
-- Rate limiting
+- Rate limiting (sync and header-aware async token buckets)
+- Adaptive (AIMD) concurrency limiting for asyncio clients
 - Circuit breaker pattern
 - Retry logic with jitter
+- Numeric rate-limit header parsing
 - Common API patterns
 """
 
 import time
 import random
+import asyncio
 from typing import Dict, Any, Optional, Callable
 
 from utils.logger import setup_logger
@@ -59,6 +62,213 @@ class RateLimiter:
             self.allowance -= 1.0
 
 
+class AsyncRateLimiter:
+    """
+    Token bucket rate limiter for asyncio clients, steered by response headers.
+
+    Proactive: spaces calls at calls_per_second (with burst_size tokens).
+    Reactive: pauses the whole bucket when the server reports it is nearly
+    out of budget (X-RateLimit-Remaining below low_water_ratio of
+    X-RateLimit-Limit) or sends Retry-After.
+
+    Uses only monotonic time (no asyncio primitives), so one instance can be
+    shared across event loops within a process and keeps its leftover budget.
+    """
+
+    def __init__(self,
+                 calls_per_second: float = 10,
+                 burst_size: float = 1.0,
+                 low_water_ratio: float = 0.1):
+        """
+        Initialize async rate limiter.
+
+        Args:
+            calls_per_second: Sustained rate limit
+            burst_size: Max tokens that can accumulate (1.0 = no burst)
+            low_water_ratio: Remaining/limit ratio below which calls are paused
+        """
+        self.rate = calls_per_second
+        self.burst_size = max(1.0, burst_size)
+        self.low_water_ratio = low_water_ratio
+        self.allowance = min(1.0, self.burst_size)
+        self.last_check = time.monotonic()
+        self._paused_until = 0.0
+
+    async def acquire(self) -> None:
+        """Reserve one token and sleep until it (and any pause) is available."""
+        while True:
+            now = time.monotonic()
+            # last_check sits in the future while a pause is active: no refill
+            if now > self.last_check:
+                self.allowance = min(self.burst_size,
+                                     self.allowance + (now - self.last_check) * self.rate)
+                self.last_check = now
+
+            # Reserve synchronously so concurrent callers queue behind each other
+            self.allowance -= 1.0
+            wait = self.last_check - now
+            if self.allowance < 0:
+                wait += -self.allowance / self.rate
+
+            if wait <= 0:
+                return
+
+            paused_until = self._paused_until
+            logger.debug(f"Async rate limiting: sleeping {wait:.3f}s")
+            await asyncio.sleep(wait)
+
+            # A pause set while sleeping voids this reservation: queue again
+            if self._paused_until == paused_until:
+                return
+
+    def pause(self, seconds: float) -> None:
+        """
+        Block new calls for the given number of seconds.
+
+        Tokens are re-spaced from the end of the pause (no accumulated burst).
+        Callers already sleeping in acquire() drop their reservation and
+        re-queue behind the pause, so the bucket restarts empty.
+        """
+        until = time.monotonic() + seconds
+        if until <= self._paused_until:
+            return
+        self._paused_until = until
+        self.last_check = max(self.last_check, until)
+        self.allowance = 0.0
+
+    def update_from_headers(self, headers: Any) -> None:
+        """
+        Apply server rate-limit feedback.
+
+        Handles:
+        - Retry-After: seconds to wait before the next call
+        - X-RateLimit-Limit / X-RateLimit-Remaining: pause when nearly exhausted
+        - X-RateLimit-Reset: seconds until the window resets (pause length)
+        """
+        retry_after = header_seconds(headers, 'Retry-After')
+        limit = header_seconds(headers, 'X-RateLimit-Limit')
+        remaining = header_seconds(headers, 'X-RateLimit-Remaining')
+
+        if limit and remaining is not None and remaining < limit * self.low_water_ratio:
+            pause = retry_after or header_seconds(headers, 'X-RateLimit-Reset') or 1.0 / self.rate
+            logger.warning(f"Rate limit budget low ({remaining:.0f}/{limit:.0f}), pausing {pause:.1f}s")
+            self.pause(pause)
+        elif retry_after:
+            logger.warning(f"Server requested Retry-After {retry_after:.1f}s")
+            self.pause(retry_after)
+
+    async def __aenter__(self):
+        """Context manager entry - acquire a token."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit (tokens are not returned)."""
+        return None
+
+
+def header_seconds(headers: Any, name: str) -> Optional[float]:
+    """
+    Read a numeric header value (e.g. Retry-After in seconds).
+
+    Missing or non-numeric values (such as HTTP-date Retry-After) give None;
+    negative values are clamped to 0.
+    """
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async concurrency limiter with AIMD (additive increase, multiplicative decrease).
+
+    Works like an asyncio.Semaphore whose size adapts to server feedback:
+    the limit is halved on throttling/timeouts and grows back slowly on
+    success, so concurrency settles just below the server's ceiling.
+
+    A burst of in-flight requests throttled together counts as one event:
+    throttles from requests started before the last decrease are ignored.
+
+    Example:
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16)
+        async with limiter:
+            started = time.monotonic()
+            response = await session.get(url)
+            if response.status == 429:
+                limiter.record_throttle(started)
+            else:
+                limiter.record_success()
+    """
+
+    def __init__(self,
+                 max_limit: int = 16,
+                 min_limit: int = 1,
+                 increase_step: float = 0.5,
+                 decrease_factor: float = 0.5):
+        """
+        Initialize adaptive limiter.
+
+        Args:
+            max_limit: Upper bound (and starting value) for in-flight operations
+            min_limit: Lower bound the limit never shrinks below
+            increase_step: Amount added to the limit per successful operation
+            decrease_factor: Multiplier applied to the limit on throttling
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.current_limit = float(self.max_limit)
+        self._last_decrease = float('-inf')
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Effective number of operations allowed in flight."""
+        return max(self.min_limit, int(self.current_limit))
+
+    def record_success(self) -> None:
+        """Additive increase after a successful operation."""
+        self.current_limit = min(float(self.max_limit), self.current_limit + self.increase_step)
+
+    def record_throttle(self, started_at: Optional[float] = None) -> None:
+        """
+        Multiplicative decrease after throttling, timeouts or overload errors.
+
+        Args:
+            started_at: time.monotonic() when the throttled request was sent;
+                        requests sent before the last decrease are ignored so
+                        one throttling event shrinks the limit only once
+        """
+        if started_at is not None and started_at <= self._last_decrease:
+            logger.debug("Adaptive limiter: throttle from before last decrease ignored")
+            return
+        previous = self.limit
+        self.current_limit = max(float(self.min_limit), self.current_limit * self.decrease_factor)
+        self._last_decrease = time.monotonic()
+        if self.limit < previous:
+            logger.warning(f"Adaptive limiter: concurrency reduced {previous} -> {self.limit}")
+
+    async def __aenter__(self):
+        """Wait until an in-flight slot is free under the current limit."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Release the slot and wake waiters (the limit may have grown)."""
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+
 class CircuitBreaker:
     """
     Circuit breaker pattern implementation.
@@ -17,16 +17,19 @@ import threading
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Union, Dict, Any, Optional, List, Literal
+from typing import Union, Dict, Any, Optional, List, Literal, TYPE_CHECKING
 
 from utils.logger import setup_logger
 from utils.path_helpers import CategoryType, get_path, format_size
 from utils.exceptions import FileOperationError, ValidationError
 
 # Hard-fail imports - TXO requires properly configured environment
-import pandas as pd
+# (pandas and openpyxl are imported inside the CSV/Excel helpers: they are the
+# heaviest imports and scripts that only save JSON/text should not pay for them)
 import yaml
-import openpyxl  # Used by pandas for Excel operations (engine='openpyxl')
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = setup_logger()
 
@@ -484,7 +487,7 @@ class TxoDataHandler:
         Raises:
             FileOperationError: If file cannot be read
         """
-        # Direct import - hard-fail if not available
+        import pandas as pd  # Lazy import - hard-fail here if not available
 
         delimiter = delimiter or TxoDataHandler.DEFAULT_CSV_DELIMITER
         encoding = encoding or TxoDataHandler.DEFAULT_ENCODING
@@ -547,8 +550,8 @@ class TxoDataHandler:
             FileOperationError: If file cannot be read
             ValidationError: If sheet doesn't exist
         """
-        # Direct import - hard-fail if not available
-        # openpyxl available via direct import
+        import pandas as pd  # Lazy import - hard-fail here if not available
+        import openpyxl  # noqa: F401 - pandas engine='openpyxl'; hard-fail here if missing
 
         file_path = get_path(directory, filename, ensure_parent=False)
         logger.debug(f"Loading Excel from {file_path} (sheet: {sheet_name})")
@@ -129,14 +129,19 @@ class TkoComplianceValidator:
 
     def _check_framework_patterns(self, content: str) -> None:
         """Check for standard TXO script patterns."""
+        # (pattern, import to suggest); either script_runner entry point is fine,
+        # parse_custom_args_and_load_config adds script-specific CLI flags
         required_imports = [
-            'from utils.script_runner import parse_args_and_load_config',
-            'from utils.load_n_save import TxoDataHandler',
-            'from utils.logger import setup_logger'
+            (r'from utils\.script_runner import .*\bparse_(custom_)?args_and_load_config\b',
+             'from utils.script_runner import parse_args_and_load_config'),
+            (r'from utils\.load_n_save import .*\bTxoDataHandler\b',
+             'from utils.load_n_save import TxoDataHandler'),
+            (r'from utils\.logger import .*\bsetup_logger\b',
+             'from utils.logger import setup_logger')
         ]
 
-        for import_stmt in required_imports:
-            if import_stmt not in content:
+        for pattern, import_stmt in required_imports:
+            if not re.search(pattern, content):
                 self.violations.append({
                     "type": "MISSING_TXO_IMPORT",
                     "message": f"Missing standard TXO import: {import_stmt}",